@@ -46,9 +46,7 @@ if anova_results:
     print(f"\nANOVA Results: \nF-Statistic: {f_statistic:.2f}, P-Value: {p_value:.3f}")
 
 # Linear Regression example: (only use numerical values)
-# Since our dataset doesn't have direct numerical features, creating a numerical column.
-df['duration_seconds'] = df['duration (seconds)'] #making sure the column is float
-regression_results = perform_linear_regression(df, target='duration_seconds', features=['latitude', 'longitude'])
+regression_results = perform_linear_regression(df, target='duration (seconds)', features=['latitude', 'longitude'])
 if regression_results:
     print("\nLinear Regression Results:\n", regression_results.summary())
 
@@ -75,14 +73,14 @@ plot_bar_chart(df, column='shape', title="Distribution of UFO Shapes")
 plot_line_chart(df.sort_values(by = 'datetime'), x_col = 'datetime', y_col = 'duration (seconds)',
                 title="Duration Over Time", marker='.')
 #plot correlation matrix
-plot_correlation_matrix(df[['duration (seconds)','latitude','longitude']], title = "Correlation Matrix")
+plot_correlation_matrix(df[['duration (seconds)','latitude','longitude']], title = "Correlation Matrix", corr = corr_matrix)
 #plot pie chart
 plot_pie_chart(df, column = 'country', title = "UFO sighting by Country")
 #pair plot.
 plot_pair_plot(df, columns=['duration (seconds)','latitude','longitude'], hue = 'location_cluster')
 
 # Export Clean Data
-output_file = 'cleaned_complete_data.csv'
+output_file = 'cleaned_complete_data.parquet'
 export_result = export_data(df, output_file)
 if export_result:
     print(f"\nCleaned data exported to: {output_file}")
\ No newline at end of file
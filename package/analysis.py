@@ -1,10 +1,18 @@
 import pandas as pd
 import numpy as np
+import sys
 from scipy import stats
 import statsmodels.api as sm
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from sklearn.metrics import silhouette_score
 
+def _is_dask(df):
+    """Helper function to check if a DataFrame is a lazy Dask DataFrame."""
+    if 'dask.dataframe' not in sys.modules: # a Dask DataFrame can only exist once dask is imported.
+        return False
+    import dask.dataframe as dd
+    return isinstance(df, dd.DataFrame)
+
 def calculate_descriptive_statistics(df, columns=None):
     """
     Calculates descriptive statistics for specified columns in a DataFrame.
@@ -23,6 +31,8 @@ def calculate_descriptive_statistics(df, columns=None):
       columns = numeric_cols
 
     desc_stats = df[columns].describe()
+    if _is_dask(df):
+      desc_stats = desc_stats.compute()
     return desc_stats
 
 def calculate_correlation(df, method='pearson', columns=None):
@@ -42,6 +52,16 @@ def calculate_correlation(df, method='pearson', columns=None):
         print("No numerical columns to calculate correlation.")
         return None
       columns = numeric_cols
+    if _is_dask(df):
+      if method == 'pearson':
+        return df[columns].corr().compute()
+      # Dask only implements pearson, so the selected columns are collected for the rank correlations.
+      return df[columns].compute().corr(method=method)
+    if method == 'pearson':
+      arr = np.ascontiguousarray(df[columns].to_numpy(dtype=np.float64))
+      if not np.isnan(arr).any(): # pandas is only needed for pairwise deletion of missing values.
+        corr = np.atleast_2d(np.corrcoef(arr, rowvar=False))
+        return pd.DataFrame(corr, index=columns, columns=columns)
     corr_matrix = df[columns].corr(method=method)
     return corr_matrix
 
@@ -54,12 +74,15 @@ def perform_t_test(df, col1, col2, equal_var=True):
         col1 (str): The first column for the t-test.
         col2 (str): The second column for the t-test.
         equal_var (bool, optional): If True, performs a standard independent 2 sample t-test that assumes equal population variances. If False, performs Welch’s t-test that does not assume equal population variances.
+        Missing values are ignored.
 
     Returns:
         tuple: A tuple containing the t-statistic and p-value, or None on error.
     """
     try:
-      t_statistic, p_value = stats.ttest_ind(df[col1], df[col2], equal_var=equal_var)
+      a = df[col1].to_numpy(dtype=np.float64)
+      b = df[col2].to_numpy(dtype=np.float64)
+      t_statistic, p_value = stats.ttest_ind(a, b, equal_var=equal_var, nan_policy='omit')
       return t_statistic, p_value
     except Exception as e:
       print(f"Error performing t-test: {e}")
@@ -76,8 +99,8 @@ def perform_anova(df, column, group_column):
       tuple: A tuple containing the F-statistic and p-value, or None on error.
     """
   try:
-    unique_groups = df[group_column].unique()
-    groups = [df[column][df[group_column] == g] for g in unique_groups]
+    data = df[[column, group_column]].dropna(subset=[column])
+    groups = [g.to_numpy() for _, g in data.groupby(group_column, sort=False, observed=True)[column]] # single pass over the groups.
     f_statistic, p_value = stats.f_oneway(*groups)
     return f_statistic, p_value
   except Exception as e:
@@ -85,7 +108,7 @@ def perform_anova(df, column, group_column):
     return None
 
 
-def perform_linear_regression(df, target, features, add_constant=True):
+def perform_linear_regression(df, target, features, add_constant=True, summary=True):
     """
     Performs a linear regression analysis.
 
@@ -94,11 +117,24 @@ def perform_linear_regression(df, target, features, add_constant=True):
       target (str): The target variable (dependent variable).
       features (list): The list of feature variables (independent variables).
       add_constant (bool): If True, add a constant term for intercept to the regression model.
+      summary (bool): If True, fit a statsmodels OLS model with full statistics (standard errors, R², ...).
+        If False, only solve for the coefficients with a single least-squares call, which is much faster.
 
     Returns:
-        statsmodels.regression.linear_model.RegressionResultsWrapper: Regression results, or None on error.
+        statsmodels.regression.linear_model.RegressionResultsWrapper: Regression results if summary is True,
+        tuple: The coefficients (pd.Series) and residuals (np.ndarray) if summary is False, or None on error.
     """
     try:
+        if not summary:
+          X = df[features].to_numpy(dtype=np.float64)
+          names = list(features)
+          if add_constant:
+            X = np.column_stack([np.ones(len(X)), X])
+            names = ['const'] + names
+          y = df[target].to_numpy(dtype=np.float64)
+          coef, *_ = np.linalg.lstsq(X, y, rcond=None)
+          residuals = y - X @ coef
+          return pd.Series(coef, index=names), residuals
         X = df[features]
         if add_constant:
            X = sm.add_constant(X)
@@ -111,7 +147,28 @@ def perform_linear_regression(df, target, features, add_constant=True):
         return None
 
 
-def perform_kmeans_clustering(df, columns, n_clusters, random_state=42):
+def _perform_dask_kmeans_clustering(df, columns, n_clusters, random_state=42, silhouette_sample_size=10000):
+    """Helper function running K-Means on a Dask DataFrame with dask_ml, see `perform_kmeans_clustering`."""
+    try:
+        from dask_ml.cluster import KMeans as DaskKMeans
+        X = df[columns].to_dask_array(lengths=True)
+        kmeans = DaskKMeans(n_clusters=n_clusters, random_state=random_state)
+        kmeans.fit(X)
+        cluster_labels = np.asarray(kmeans.labels_)
+        if silhouette_sample_size is not None and silhouette_sample_size < len(cluster_labels):
+            # Only the sampled rows are loaded into memory for the silhouette score.
+            rng = np.random.RandomState(random_state)
+            idx = np.sort(rng.choice(len(cluster_labels), silhouette_sample_size, replace=False))
+            silhouette = silhouette_score(X[idx].compute(), cluster_labels[idx])
+        else:
+            silhouette = silhouette_score(X.compute(), cluster_labels)
+        return cluster_labels, silhouette
+    except Exception as e:
+       print(f"Error during k-means clustering: {e}")
+       return None
+
+def perform_kmeans_clustering(df, columns, n_clusters, random_state=42, minibatch=False, batch_size=4096,
+                              algorithm='lloyd', silhouette_sample_size=10000):
     """
     Performs K-Means clustering on specified columns.
 
@@ -120,13 +177,26 @@ def perform_kmeans_clustering(df, columns, n_clusters, random_state=42):
       columns (list): Columns to perform clustering on
       n_clusters (int): The number of clusters to form.
       random_state (int): Random state for reproducibility
+      minibatch (bool): If True, use MiniBatchKMeans, which is much faster on large datasets at a small cost in accuracy.
+      batch_size (int): Size of the mini batches when minibatch is True.
+      algorithm (str): K-Means algorithm for the exact path, 'lloyd' or 'elkan'.
+      silhouette_sample_size (int, optional): Number of rows sampled to compute the silhouette score.
+        If None, all rows are used.
     Returns:
       tuple: The cluster labels and the silhouette score, or None on error.
     """
+    if _is_dask(df):
+      return _perform_dask_kmeans_clustering(df, columns, n_clusters, random_state, silhouette_sample_size)
     try:
-        kmeans = KMeans(n_clusters=n_clusters, random_state=random_state, n_init=10)  #Added n_init to handle future update issue
-        cluster_labels = kmeans.fit_predict(df[columns])
-        silhouette = silhouette_score(df[columns],cluster_labels)
+        if minibatch:
+            kmeans = MiniBatchKMeans(n_clusters=n_clusters, random_state=random_state, batch_size=batch_size, n_init=3)
+        else:
+            kmeans = KMeans(n_clusters=n_clusters, random_state=random_state, n_init=10, algorithm=algorithm)  #Added n_init to handle future update issue
+        X = df[columns]
+        cluster_labels = kmeans.fit_predict(X)
+        if silhouette_sample_size is not None and silhouette_sample_size >= len(X):
+            silhouette_sample_size = None # sampling is only needed when there are more rows than the sample size.
+        silhouette = silhouette_score(X, cluster_labels, sample_size=silhouette_sample_size, random_state=random_state)
         return cluster_labels, silhouette
     except Exception as e:
        print(f"Error during k-means clustering: {e}")
@@ -1,8 +1,23 @@
-from myDataLib.io import import_data
+from myDataLib.io import import_data, _read_data, _report_import_error
 import pandas as pd
 import numpy as np
 from sklearn.preprocessing import StandardScaler, MinMaxScaler
-from sklearn.impute import SimpleImputer
+import re
+import pyarrow as pa
+import pyarrow.compute as pc
+
+try:
+    from numba import njit, prange
+except ImportError: # numba is optional, the NumPy implementation is used without it.
+    njit = None
+
+_SPECIAL_CHARS_RE = re.compile(r'[^a-zA-Z0-9\s]')
+# ASCII bytes matched by _SPECIAL_CHARS_RE, deleted with bytes.translate on pure ASCII strings.
+_ASCII_SPECIAL_CHARS = bytes(c for c in range(128) if _SPECIAL_CHARS_RE.match(chr(c)))
+# Characters matched by str.isspace (U+3000 is the highest one), used so the pyarrow kernels,
+# whose RE2 `\s` is ASCII only, strip and keep exactly the same whitespace as Python.
+_WHITESPACE = ''.join(chr(c) for c in range(0x3001) if chr(c).isspace())
+_ARROW_SPECIAL_CHARS = '[^a-zA-Z0-9' + ''.join(f'\\x{{{ord(c):x}}}' for c in _WHITESPACE) + ']'
 
 def handle_missing_values(df, strategy='mean', columns=None, fill_value=None):
     """
@@ -29,31 +44,64 @@ def handle_missing_values(df, strategy='mean', columns=None, fill_value=None):
       if fill_value is None:
         raise ValueError("Must provide a fill_value if strategy is 'constant'.")
       df[columns] = df[columns].fillna(fill_value)
-    elif strategy in ['mean', 'median', 'mode']:
-      imputer = SimpleImputer(strategy=strategy)
-      df[columns] = imputer.fit_transform(df[columns])
+    elif strategy in ['mean', 'median']:
+      # Work on the numeric block directly and write it back in a single assignment.
+      mat = df[columns].to_numpy(dtype=np.float64)
+      col_stats = np.nanmean(mat, axis=0) if strategy == 'mean' else np.nanmedian(mat, axis=0)
+      df[columns] = np.where(np.isnan(mat), col_stats, mat)
+    elif strategy == 'mode':
+      # Each column is filled with its own most frequent value, so numeric and text columns keep their dtypes.
+      modes = df[columns].mode()
+      if not modes.empty:
+        df[columns] = df[columns].fillna(modes.iloc[0])
     else:
       raise ValueError("Invalid strategy. Choose 'mean', 'median', 'mode', 'constant', or 'drop'.")
     return df
 
+if njit is not None:
+    # fastmath is left off on purpose: it assumes no NaNs, and rows with NaN must be flagged as outliers.
+    @njit(parallel=True, cache=True)
+    def _iqr_mask_kernel(cols, lower_bound, upper_bound):
+        """Numba kernel returning True for rows where every value lies within its column bounds.
+        `cols` holds one column per row, so each column is scanned contiguously."""
+        n_rows = cols.shape[1]
+        out = np.empty(n_rows, dtype=np.bool_)
+        for i in prange(n_rows):
+            keep = True
+            for j in range(cols.shape[0]):
+                v = cols[j, i]
+                keep &= (v >= lower_bound[j]) & (v <= upper_bound[j])
+            out[i] = keep
+        return out
+
+def _iqr_mask(df, columns, factor=1.5):
+    """Helper function returning a boolean array that is True for rows within the IQR bounds of every column."""
+    q = df[columns].quantile([0.25, 0.75])
+    IQR = q.loc[0.75] - q.loc[0.25]
+    lower_bound = (q.loc[0.25] - factor * IQR).to_numpy()
+    upper_bound = (q.loc[0.75] + factor * IQR).to_numpy()
+    if njit is not None:
+        cols = df[columns].to_numpy(dtype=np.float64).T # pandas returns column-major data, so .T is C-contiguous.
+        return _iqr_mask_kernel(cols, lower_bound.astype(np.float64), upper_bound.astype(np.float64))
+    arr = df[columns].to_numpy()
+    return ((arr >= lower_bound) & (arr <= upper_bound)).all(axis=1)
+
 def remove_outliers_iqr(df, column, factor=1.5):
     """
-    Removes outliers from a DataFrame column using the IQR method.
+    Removes outliers from one or more DataFrame columns using the IQR method.
 
     Args:
         df (pd.DataFrame): The input DataFrame.
-        column (str): The name of the column to check for outliers.
+        column (str or list): The name of the column, or a list of columns, to check for outliers.
+          With a list, the bounds of all columns are computed in one pass and a row is removed
+          if it is an outlier in any of them.
         factor (float): The IQR multiplier to define upper and lower bounds.
 
     Returns:
-        pd.DataFrame: A DataFrame with outliers removed from the specified column.
+        pd.DataFrame: A DataFrame with outliers removed from the specified column(s).
     """
-    Q1 = df[column].quantile(0.25)
-    Q3 = df[column].quantile(0.75)
-    IQR = Q3 - Q1
-    lower_bound = Q1 - factor * IQR
-    upper_bound = Q3 + factor * IQR
-    df = df[(df[column] >= lower_bound) & (df[column] <= upper_bound)]
+    columns = [column] if isinstance(column, str) else list(column)
+    df = df.loc[_iqr_mask(df, columns, factor)]
     return df
 
 def convert_column_type(df, column, dtype):
@@ -72,6 +120,22 @@ def convert_column_type(df, column, dtype):
       print(f"Error converting column {column} to type {dtype}: {e}")
     return df
 
+def _split_convert_type(convert_type):
+    """Helper function to split a {col_name:type} dictionary into the types that can be converted while
+    parsing (float and str, which accept missing values) and the ones to convert after missing values are handled."""
+    read_dtype = {}
+    after_dtype = {}
+    for col, col_type in convert_type.items():
+        try:
+            safe = pd.api.types.is_float_dtype(col_type) or pd.api.types.is_string_dtype(col_type)
+        except TypeError:
+            safe = False
+        if safe:
+            read_dtype[col] = col_type
+        else:
+            after_dtype[col] = col_type
+    return read_dtype, after_dtype
+
 def normalize_data(df, columns, method='standard'):
     """
     Normalizes specified columns in a DataFrame using standard scaling or min-max scaling.
@@ -94,45 +158,92 @@ def normalize_data(df, columns, method='standard'):
     else:
         raise ValueError("Invalid normalization method. Choose 'standard' or 'minmax'.")
 
-    df[columns] = scaler.fit_transform(df[columns])
+    df[columns] = scaler.fit_transform(df[columns].to_numpy())
     return df
 
-def remove_duplicates(df, subset=None, keep='first'):
+def remove_duplicates(df, subset=None, keep='first', categorize=False):
     """
     Removes duplicate rows from a DataFrame.
 
     Args:
         df (pd.DataFrame): The input DataFrame.
         subset (list, optional): List of column names to consider for duplicates. If None, all columns are used.
+          Restricting it to the key columns (e.g. datetime and location) avoids hashing long text columns.
         keep (str, optional): 'first', 'last', or False, determines which duplicates to keep.
+        categorize (bool, optional): If True, text columns considered for duplicates are converted to the
+          'category' dtype first and returned as such, so duplicates are found on integer codes and later
+          grouping or counting on those columns reuses them. Defaults to False.
 
     Returns:
         pd.DataFrame: A DataFrame with duplicate rows removed.
     """
+    if categorize:
+        cols = df.columns if subset is None else ([subset] if isinstance(subset, str) else list(subset))
+        text_cols = df[cols].select_dtypes(include=['object', 'string']).columns
+        df = df.astype(dict.fromkeys(text_cols, 'category'))
     df = df.drop_duplicates(subset=subset, keep=keep)
     return df
 
-def clean_text_column(df, column, lower=True, remove_space=True, remove_special=True):
-    """Cleans a text column by converting to lowercase and/or removing spaces or special characters."""
+def _remove_special_chars(text):
+    """Helper function removing everything but ASCII letters, numbers and whitespace from a string."""
+    if text.isascii():
+        return text.encode('ascii').translate(None, _ASCII_SPECIAL_CHARS).decode('ascii')
+    return _SPECIAL_CHARS_RE.sub('', text)
+
+def _clean_text_arrow(series, lower=True, remove_space=True, remove_special=True):
+    """Helper function cleaning a text Series with pyarrow compute kernels.
+
+    Returns None if the Series does not only hold strings and missing values.
+    """
+    try:
+        arr = pa.array(series, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+    if not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+        return None
     if lower:
-        df[column] = df[column].str.lower()
+        arr = pc.utf8_lower(arr)
     if remove_space:
-      df[column] = df[column].str.strip()
-    if remove_special: #Removes special chars, keeps letter and numbers.
-        df[column] = df[column].str.replace(r'[^a-zA-Z0-9\s]', '', regex=True)
+        arr = pc.utf8_trim(arr, characters=_WHITESPACE)
+    if remove_special:
+        arr = pc.replace_substring_regex(arr, pattern=_ARROW_SPECIAL_CHARS, replacement='')
+    if series.dtype == object:
+        # pd.array would infer a string dtype, so object columns are rebuilt as object with their original missing values.
+        result = pd.Series(arr.to_numpy(zero_copy_only=False), index=series.index, name=series.name, dtype=object)
+        return result.where(series.notna(), series)
+    return pd.Series(pd.array(arr, dtype=series.dtype), index=series.index, name=series.name)
+
+def clean_text_column(df, column, lower=True, remove_space=True, remove_special=True):
+    """Cleans a text column by converting to lowercase and/or removing spaces or special characters."""
+    def clean(text):
+        if not isinstance(text, str):
+            return text
+        if lower:
+            text = text.lower()
+        if remove_space:
+            text = text.strip()
+        if remove_special: #Removes special chars, keeps letter and numbers.
+            text = _remove_special_chars(text)
+        return text
+
+    if lower or remove_space or remove_special:
+        # Text columns are cleaned on the Arrow buffers, mixed columns in a single Python pass.
+        cleaned = _clean_text_arrow(df[column], lower, remove_space, remove_special)
+        df[column] = cleaned if cleaned is not None else df[column].map(clean)
     return df
 
 def clean_data(filepath, strategy='mean', outlier_cols=None, outlier_factor=1.5,
                normalize_cols=None, normalize_method='standard',
                convert_type = None, dup_subset = None, dup_keep='first',
-               text_cols=None,text_lower=True, text_space=True, text_special=True):
+               text_cols=None,text_lower=True, text_space=True, text_special=True, downcast=None):
     """
     Imports data and applies cleaning steps.
 
     Args:
         filepath (str): Path to the data file.
         strategy (str): Missing value handling strategy ('mean', 'median', 'mode', 'constant', 'drop').
-        outlier_cols (list): Columns to remove outliers from.
+          'mean' and 'median' are applied to numerical columns only.
+        outlier_cols (list): Columns to remove outliers from. Rows outside the IQR bounds of any column are removed.
         outlier_factor (float): IQR multiplier for outlier removal.
         normalize_cols (list): Columns to normalize.
         normalize_method (str): Normalization method ('standard', 'minmax').
@@ -143,32 +254,59 @@ def clean_data(filepath, strategy='mean', outlier_cols=None, outlier_factor=1.5,
         text_lower (bool): if True, all text will be lower case.
         text_space (bool) : if True, all space at the end will be removed.
         text_special (bool): If True, any special characters will be removed.
+        downcast (str, optional): If 'float32', float64 columns are converted to float32 after cleaning,
+          halving their memory use for downstream analysis. If None (default), dtypes are kept.
 
     Returns:
         pd.DataFrame: The cleaned DataFrame.
     """
 
-    df = import_data(filepath)
+    if downcast not in [None, 'float32']:
+      raise ValueError("Invalid downcast. Choose 'float32' or None.")
+
+    read_dtype, after_dtype = _split_convert_type(convert_type) if convert_type else ({}, {})
+    if read_dtype:
+      try:
+        df = _read_data(filepath, dtype=read_dtype) # float and str types are converted while parsing.
+      except (ValueError, TypeError) as e:
+        if isinstance(e, (pd.errors.ParserError, pd.errors.EmptyDataError)):
+          _report_import_error(filepath, e)
+          return None
+        # A cell could not be converted to its type, so every column is converted after import instead.
+        after_dtype = convert_type
+        df = import_data(filepath)
+      except Exception as e:
+        _report_import_error(filepath, e)
+        return None
+    else:
+      df = import_data(filepath)
     if df is None:
       return None
 
-    df = handle_missing_values(df, strategy)
+    if strategy in ['mean', 'median']:
+      # Impute all numeric columns with missing values in a single pass.
+      num_cols = df.select_dtypes(include=np.number).columns
+      df = handle_missing_values(df, strategy, columns=num_cols[df[num_cols].isnull().any()].tolist())
+    else:
+      df = handle_missing_values(df, strategy)
+
+    for col, col_type in after_dtype.items():
+      df = convert_column_type(df, col, col_type)
 
     if outlier_cols:
-      for col in outlier_cols:
-        df = remove_outliers_iqr(df, col, outlier_factor)
+      df = remove_outliers_iqr(df, outlier_cols, outlier_factor) # all columns are filtered in one pass.
 
     if normalize_cols:
         df = normalize_data(df, normalize_cols, normalize_method)
 
-    if convert_type:
-      for col, type in convert_type.items():
-          df = convert_column_type(df,col,type)
-
     df = remove_duplicates(df, subset=dup_subset, keep=dup_keep)
 
     if text_cols:
       for col in text_cols:
         df = clean_text_column(df, col, lower=text_lower, remove_space=text_space, remove_special=text_special)
 
+    if downcast == 'float32':
+      float_cols = df.select_dtypes(include='float64').columns
+      df = df.astype(dict.fromkeys(float_cols, np.float32)) # all columns are cast in a single pass.
+
     return df
\ No newline at end of file
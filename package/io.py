@@ -2,7 +2,161 @@ import pandas as pd
 import os
 import json
 
-def import_data(filepath, file_type=None):
+def _apply_schema(df, usecols=None, dtype=None, parse_dates=None, to_datetime=pd.to_datetime):
+    """Helper function to select and cast columns for readers without native support."""
+    if usecols is not None:
+        df = df[list(usecols)]
+    if dtype is not None:
+        df = df.astype(dtype)
+    if parse_dates:
+        for col in parse_dates:
+            df[col] = to_datetime(df[col])
+    return df
+
+
+def _iter_chunks(reader, transform=None, first=None):
+    """Helper generator yielding the chunks of an opened pandas reader, closing it when done.
+    If `first` is given, it is yielded before the chunks left in the reader."""
+    with reader:
+        if first is not None:
+            yield first
+        for chunk in reader:
+            yield chunk if transform is None else transform(chunk)
+
+
+def _iter_parquet_chunks(batches, dtype=None, parse_dates=None):
+    """Helper generator converting pyarrow record batches into DataFrames with continuous row numbering."""
+    start = 0
+    for batch in batches:
+        chunk = batch.to_pandas()
+        chunk.index = pd.RangeIndex(start, start + len(chunk)) # continue the row numbering like the csv reader.
+        start += len(chunk)
+        yield _apply_schema(chunk, dtype=dtype, parse_dates=parse_dates)
+
+
+def _is_json_array(filepath):
+    """Helper function to check if a JSON file holds a single array rather than one record per line."""
+    with open(filepath) as f:
+        for line in f:
+            if line.strip():
+                return line.lstrip().startswith('[')
+    return False
+
+
+def _read_chunks(filepath, file_type, chunksize, usecols=None, dtype=None, parse_dates=None, **kwargs):
+    """Helper function opening a chunked reader and returning a generator of DataFrames of at most `chunksize` rows.
+
+    The file is opened here rather than on the first chunk, so setup errors such as missing columns are raised
+    immediately.
+    """
+    if file_type == 'csv':
+        kwargs.setdefault('engine', 'c')
+        reader = pd.read_csv(filepath, chunksize=chunksize, usecols=usecols, dtype=dtype,
+                             parse_dates=parse_dates, **kwargs)
+        return _iter_chunks(reader)
+    elif file_type == 'json':
+        kwargs.setdefault('lines', True)
+        reader = pd.read_json(filepath, chunksize=chunksize, **kwargs)
+        transform = lambda chunk: _apply_schema(chunk, usecols, dtype, parse_dates)
+        # JSON lines have no header, so the first chunk is read here to check the columns.
+        try:
+            first = transform(next(reader))
+        except StopIteration:
+            first = None
+        except Exception:
+            reader.close()
+            raise
+        return _iter_chunks(reader, transform, first)
+    elif file_type == 'parquet':
+        import pyarrow.parquet as pq
+        parquet_file = pq.ParquetFile(filepath)
+        if usecols is not None:
+            missing = [col for col in usecols if col not in parquet_file.schema_arrow.names]
+            if missing:
+                raise ValueError(f"Columns not found in '{filepath}': {missing}")
+        batches = parquet_file.iter_batches(batch_size=chunksize, columns=usecols, **kwargs)
+        return _iter_parquet_chunks(batches, dtype=dtype, parse_dates=parse_dates)
+    else:
+        raise ValueError(f"Chunked reading is not supported for file type '{file_type}'.")
+
+
+class _ImportDataError(Exception):
+    """Raised by `_read_data` for invalid input, reported by `import_data` as a plain error message."""
+
+
+def _read_data(filepath, file_type=None, usecols=None, dtype=None, parse_dates=None,
+               chunksize=None, stream=False, backend='pandas', **kwargs):
+    """Helper function reading a file as described in `import_data`, raising on errors instead of returning None."""
+    if not os.path.exists(filepath):
+        raise _ImportDataError(f"File not found at '{filepath}'")
+
+    if file_type is None:
+        file_type = filepath.split('.')[-1].lower()  # Infer from extension
+
+    if file_type not in ['csv', 'json', 'parquet', 'xls', 'xlsx']:
+        raise _ImportDataError(f"Unsupported file type '{file_type}'. Supported types are 'csv', 'json', 'parquet', and 'xls/xlsx'.")
+
+    if chunksize is not None and file_type not in ['csv', 'json', 'parquet']:
+        raise _ImportDataError(f"Chunked reading is not supported for file type '{file_type}'. Supported types are 'csv', 'json' and 'parquet'.")
+
+    if chunksize is not None and file_type == 'json' and (not kwargs.get('lines', True) or _is_json_array(filepath)):
+        raise _ImportDataError("Chunked reading of JSON requires a line-delimited (JSON Lines) file.")
+
+    if backend not in ['pandas', 'dask', 'modin']:
+        raise _ImportDataError(f"Unsupported backend '{backend}'. Supported backends are 'pandas', 'dask' and 'modin'.")
+    if backend != 'pandas' and chunksize is not None:
+        raise _ImportDataError("Chunked reading is only supported with the 'pandas' backend.")
+    if backend == 'dask' and file_type in ['xls', 'xlsx']:
+        raise _ImportDataError("The 'dask' backend does not support Excel files.")
+
+    try:
+        if backend == 'dask':
+            import dask.dataframe as lib
+            kwargs.setdefault('blocksize', '64MB')
+            if file_type == 'json':
+                kwargs.setdefault('lines', True) # dask can only split line-delimited JSON into blocks.
+        elif backend == 'modin':
+            import modin.pandas as lib
+        else:
+            lib = pd
+    except ImportError:
+        raise _ImportDataError(f"The '{backend}' backend requires the '{backend}' package to be installed.") from None
+
+    if chunksize is not None:
+        chunks = _read_chunks(filepath, file_type, chunksize, usecols=usecols, dtype=dtype,
+                              parse_dates=parse_dates, **kwargs)
+        if stream:
+            return chunks
+        return pd.concat(chunks)
+    elif file_type == 'csv':
+        kwargs.setdefault('engine', 'c')
+        if kwargs['engine'] == 'c':
+            kwargs.setdefault('low_memory', False) # only the C engine supports low_memory.
+        return lib.read_csv(filepath, usecols=usecols, dtype=dtype, parse_dates=parse_dates, **kwargs)
+    elif file_type == 'json':
+        return _apply_schema(lib.read_json(filepath, **kwargs), usecols, dtype, parse_dates,
+                             to_datetime=lib.to_datetime)
+    elif file_type == 'parquet':
+        return _apply_schema(lib.read_parquet(filepath, columns=usecols, **kwargs),
+                             dtype=dtype, parse_dates=parse_dates, to_datetime=lib.to_datetime)
+    else:
+        return lib.read_excel(filepath, usecols=usecols, dtype=dtype, parse_dates=parse_dates, **kwargs)
+
+
+def _report_import_error(filepath, error):
+    """Helper function printing an informative message for an error raised while importing a file."""
+    if isinstance(error, _ImportDataError):
+        print(f"Error: {error}")
+    elif isinstance(error, pd.errors.EmptyDataError):
+        print(f"Error: The file '{filepath}' is empty.")
+    elif isinstance(error, pd.errors.ParserError):
+        print(f"Error: Could not parse the file '{filepath}'. Check the file format and ensure it's valid.")
+    else:
+        print(f"An unexpected error occurred while importing '{filepath}': {error}")
+
+
+def import_data(filepath, file_type=None, usecols=None, dtype=None, parse_dates=None,
+                chunksize=None, stream=False, backend='pandas', **kwargs):
     """
     Imports data from various file formats into a pandas DataFrame.
 
@@ -10,67 +164,86 @@ def import_data(filepath, file_type=None):
         filepath: Path to the data file.
         file_type: (Optional) Explicitly specify the file type ('csv', 'json', 'parquet', 'excel').
                    If None, it will be inferred from the file extension.
+        usecols: (Optional) List of columns to read. Other columns are skipped while parsing where the
+                 reader supports it. If None (default), all columns are read.
+        dtype: (Optional) A type or a dictionary of column names to type {col_name:type}.
+               For CSV and Excel files the columns are converted while the file is parsed.
+        parse_dates: (Optional) List of columns to parse as datetimes.
+        chunksize: (Optional) Number of rows to read at a time for 'csv', 'json' (line-delimited) and
+                   'parquet' files. If None (default), the whole file is read in a single pass.
+        stream: (Optional) If True and chunksize is set, return a generator of DataFrame chunks
+                instead of a single concatenated DataFrame. Defaults to False.
+                The file is opened before returning, so errors such as missing columns are reported
+                like in the non-stream case. Errors met while iterating over the chunks are raised.
+        backend: (Optional) DataFrame library used to read the file: 'pandas' (default), 'dask' or 'modin'.
+                 'dask' returns a lazy, partitioned DataFrame (64MB blocks for CSV and line-delimited JSON)
+                 that can be larger than memory, 'modin' a DataFrame whose operations run in parallel.
+                 Both require the corresponding package to be installed.
+        **kwargs: Additional keyword arguments passed to the underlying pandas reader.
 
     Returns:
-        A pandas DataFrame containing the imported data, or None if an error occurs.
+        A DataFrame of the chosen backend containing the imported data (or a generator of DataFrames
+        if stream is True), or None if an error occurs.
         Prints an informative error message if the file is not found or the format is unsupported.
     """
-    if not os.path.exists(filepath):
-        print(f"Error: File not found at '{filepath}'")
+    try:
+        return _read_data(filepath, file_type=file_type, usecols=usecols, dtype=dtype, parse_dates=parse_dates,
+                          chunksize=chunksize, stream=stream, backend=backend, **kwargs)
+    except Exception as e:  # Catch potential errors during import
+        _report_import_error(filepath, e)
         return None
 
-    if file_type is None:
-        file_type = filepath.split('.')[-1].lower()  # Infer from extension
 
-    try:
-        if file_type == 'csv':
-            df = pd.read_csv(filepath)
-        elif file_type == 'json':
-            df = pd.read_json(filepath)
-        elif file_type == 'parquet':
-            df = pd.read_parquet(filepath)
-        elif file_type in ['xls', 'xlsx']:
-             df = pd.read_excel(filepath)
-        else:
-            print(f"Error: Unsupported file type '{file_type}'. Supported types are 'csv', 'json', 'parquet', and 'xls/xlsx'.")
-            return None
-        return df
-    except pd.errors.EmptyDataError:
-        print(f"Error: The file '{filepath}' is empty.")
-        return None
-    except pd.errors.ParserError:
-        print(f"Error: Could not parse the file '{filepath}'. Check the file format and ensure it's valid.")
-        return None
-    except Exception as e:  # Catch other potential errors during import
-        print(f"An unexpected error occurred while importing '{filepath}': {e}")
-        return None
+def _write_parquet_chunks(df, filepath, chunksize, index=False, **kwargs):
+    """Helper function writing a DataFrame to a parquet file, one row group of `chunksize` rows at a time."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    schema = pa.Schema.from_pandas(df, preserve_index=index)
+    with pq.ParquetWriter(filepath, schema, **kwargs) as writer:
+        for start in range(0, len(df), chunksize):
+            chunk = df.iloc[start:start + chunksize]
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=index))
 
 
-def export_data(df, filepath, file_type='csv', index=False, **kwargs):
+def export_data(df, filepath, file_type=None, index=False, chunksize=None, **kwargs):
     """
     Exports a pandas DataFrame to various file formats.
 
     Args:
         df (pd.DataFrame): The DataFrame to export.
         filepath (str): The path to save the file.
-        file_type (str, optional): The file format ('csv', 'json', 'parquet', 'excel'). Default is 'csv'.
+        file_type (str, optional): The file format ('csv', 'json', 'parquet', 'excel').
+            If None (default), it is inferred from the file extension, falling back to 'parquet'.
         index (bool, optional): Whether to write the DataFrame index to the output file. Defaults to False.
+        chunksize (int, optional): Number of rows to write at a time for 'csv' and 'parquet' files.
+            For parquet, each chunk is written as a separate row group.
         **kwargs: Additional keyword arguments for specific file formats.
             For JSON export use `orient='records'` to get records (row-wise) or 'index' to get column oriented output.
             For excel export use `sheet_name`.
+            Parquet files are written with pyarrow and snappy compression unless `compression` is given.
 
     Returns:
         bool: True if export was successful, False otherwise.
     """
+    if file_type is None:
+        file_type = str(filepath).split('.')[-1].lower()  # Infer from extension
+        if file_type not in ['csv', 'json', 'parquet', 'xls', 'xlsx']:
+            file_type = 'parquet'
+
     try:
         if file_type == 'csv':
-            df.to_csv(filepath, index=index, **kwargs)
+            df.to_csv(filepath, index=index, chunksize=chunksize, **kwargs)
         elif file_type == 'json':
           if 'orient' not in kwargs:
              kwargs['orient'] = 'records' # default to record output for json.
           df.to_json(filepath, index=index, **kwargs)
         elif file_type == 'parquet':
-            df.to_parquet(filepath, index=index, **kwargs)
+            if 'compression' not in kwargs:
+                kwargs['compression'] = 'snappy'
+            if chunksize is not None:
+                _write_parquet_chunks(df, filepath, chunksize, index=index, **kwargs)
+            else:
+                df.to_parquet(filepath, engine='pyarrow', index=index, **kwargs)
         elif file_type in ['xls','xlsx']:
              if 'sheet_name' not in kwargs:
                 kwargs['sheet_name'] = 'Sheet1'
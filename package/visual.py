@@ -13,6 +13,34 @@ def _check_column_exists(df, column):
         raise ValueError(f"Column '{column}' not found in DataFrame.")
 
 
+def _sample_rows(df, max_points, hue=None, random_state=0):
+    """Helper function returning at most `max_points` random rows of a DataFrame.
+
+    If hue is given, rows are sampled proportionally within each hue group, keeping at least one row
+    per group (as long as there are fewer groups than `max_points`).
+    """
+    if max_points is None or len(df) <= max_points:
+        return df
+    if hue is None:
+        return df.sample(n=max_points, random_state=random_state)
+    groups = df.groupby(hue, dropna=False, observed=True, sort=False)
+    sizes = groups.size().to_numpy()
+    quotas = sizes * max_points / len(df)
+    counts = np.minimum(np.maximum(np.floor(quotas).astype(int), 1), sizes)
+    # Bring the total to exactly max_points: take rows back from the largest groups,
+    # or hand the rows left over to the groups with the largest rounding remainders.
+    while counts.sum() > max_points:
+        counts[np.argmax(counts)] -= 1
+    for i in np.argsort(counts - quotas):
+        if counts.sum() >= max_points:
+            break
+        if counts[i] < sizes[i]:
+            counts[i] += 1
+    samples = [group.sample(n=n, random_state=random_state)
+               for (_, group), n in zip(groups, counts) if n > 0]
+    return pd.concat(samples)
+
+
 def plot_histogram(df, column, title="Histogram", xlabel=None, bins=10, color=None, ax=None):
     """Generates a histogram for a given column in a DataFrame.
     Args:
@@ -35,7 +63,7 @@ def plot_histogram(df, column, title="Histogram", xlabel=None, bins=10, color=No
         plt.show()
 
 
-def plot_scatter(df, x_col, y_col, title="Scatter Plot", xlabel=None, ylabel=None, color=None,ax=None,alpha=1):
+def plot_scatter(df, x_col, y_col, title="Scatter Plot", xlabel=None, ylabel=None, color=None,ax=None,alpha=1, max_points=10000):
     """Generates a scatter plot for two columns in a DataFrame.
     Args:
         df (pd.DataFrame): The DataFrame containing data.
@@ -47,9 +75,12 @@ def plot_scatter(df, x_col, y_col, title="Scatter Plot", xlabel=None, ylabel=Non
         color (str, optional): Color of the scatter points.
         ax (matplotlib.axes.Axes, optional) : Matplotlib ax object to plot on.
         alpha (float, optional): Transparency value of the points.
+        max_points (int, optional): Maximum number of points to draw. Larger DataFrames are randomly sampled
+          down to this size. If None, all points are drawn. Defaults to 10000.
     """
     _check_column_exists(df, x_col)
     _check_column_exists(df, y_col)
+    df = _sample_rows(df, max_points)
     if ax is None:
       plt.figure(figsize=(8, 6))
     sns.scatterplot(x=x_col, y=y_col, data=df, color=color, ax=ax, alpha=alpha)
@@ -80,7 +111,7 @@ def plot_boxplot(df, column, title="Box Plot", xlabel=None, color=None,ax=None):
       plt.show()
 
 
-def plot_correlation_matrix(df, title="Correlation Matrix",annot=True, cmap="coolwarm",ax=None):
+def plot_correlation_matrix(df, title="Correlation Matrix",annot=True, cmap="coolwarm",ax=None, corr=None):
     """Generates a heatmap of the correlation matrix.
     Args:
         df (pd.DataFrame): The DataFrame containing data.
@@ -88,8 +119,10 @@ def plot_correlation_matrix(df, title="Correlation Matrix",annot=True, cmap="coo
         annot (bool): if True, then the correlation value is displayed.
         cmap (str): The color scheme.
         ax (matplotlib.axes.Axes, optional) : Matplotlib ax object to plot on.
+        corr (pd.DataFrame, optional): Precomputed correlation matrix, e.g. from `calculate_correlation`.
+          If None, it is computed from df.
     """
-    corr_matrix = df.corr()
+    corr_matrix = corr if corr is not None else df.corr()
     if ax is None:
       plt.figure(figsize=(10, 8))
     sns.heatmap(corr_matrix, annot=annot, cmap=cmap, ax=ax)
@@ -98,7 +131,7 @@ def plot_correlation_matrix(df, title="Correlation Matrix",annot=True, cmap="coo
       plt.show()
 
 
-def plot_bar_chart(df, column, title="Bar Chart", xlabel=None, ylabel="Count", color=None,ax=None):
+def plot_bar_chart(df, column, title="Bar Chart", xlabel=None, ylabel="Count", color=None,ax=None, value_counts=None):
     """Creates a bar chart showing the counts of unique values in a column.
      Args:
         df (pd.DataFrame): The DataFrame containing data.
@@ -108,9 +141,11 @@ def plot_bar_chart(df, column, title="Bar Chart", xlabel=None, ylabel="Count", c
         ylabel (str, optional): The y-axis label. Defaults to "Count".
         color (str, optional): The color of the bars.
         ax (matplotlib.axes.Axes, optional) : Matplotlib ax object to plot on.
+        value_counts (pd.Series, optional): Precomputed `df[column].value_counts()` to reuse. If None, it is computed.
     """
     _check_column_exists(df, column)
-    value_counts = df[column].value_counts()
+    if value_counts is None:
+      value_counts = df[column].value_counts()
     if ax is None:
       plt.figure(figsize=(10, 6))
     value_counts.plot(kind='bar', color=color, ax=ax)
@@ -148,7 +183,7 @@ def plot_line_chart(df, x_col, y_col, title="Line Chart", xlabel=None, ylabel=No
     if ax is None:
         plt.show()
 
-def plot_pie_chart(df, column, title="Pie Chart", labels=None, colors=None, ax=None, autopct='%1.1f%%'):
+def plot_pie_chart(df, column, title="Pie Chart", labels=None, colors=None, ax=None, autopct='%1.1f%%', value_counts=None):
     """Creates a pie chart showing the distribution of values in a column.
      Args:
         df (pd.DataFrame): The DataFrame containing data.
@@ -158,10 +193,12 @@ def plot_pie_chart(df, column, title="Pie Chart", labels=None, colors=None, ax=N
         colors (list, optional): Colors for the pie chart slices.
         ax (matplotlib.axes.Axes, optional) : Matplotlib ax object to plot on.
         autopct (str, optional): String for how values will be displayed.
+        value_counts (pd.Series, optional): Precomputed `df[column].value_counts()` to reuse. If None, it is computed.
 
     """
     _check_column_exists(df, column)
-    value_counts = df[column].value_counts()
+    if value_counts is None:
+      value_counts = df[column].value_counts()
     if ax is None:
       plt.figure(figsize=(8,8))
     value_counts.plot(kind='pie', autopct=autopct, labels=labels, colors=colors, ax=ax)
@@ -170,7 +207,7 @@ def plot_pie_chart(df, column, title="Pie Chart", labels=None, colors=None, ax=N
     if ax is None:
       plt.show()
 
-def plot_pair_plot(df, columns=None, title="Pair Plot", hue=None, palette=None, ax=None):
+def plot_pair_plot(df, columns=None, title="Pair Plot", hue=None, palette=None, ax=None, max_points=10000):
     """Generates a pair plot for the selected columns.
 
       Args:
@@ -180,16 +217,25 @@ def plot_pair_plot(df, columns=None, title="Pair Plot", hue=None, palette=None,
         hue (str, optional): Column name to color points by.
         palette (str, optional): The color palette to use.
          ax (matplotlib.axes.Axes, optional) : Matplotlib ax object to plot on.
+        max_points (int, optional): Maximum number of rows to plot. Larger DataFrames are randomly sampled
+          down to this size, stratified by hue if given. If None, all rows are plotted. Defaults to 10000.
     """
     if columns:
         for col in columns:
           _check_column_exists(df, col)
     else:
         columns = df.columns
+    columns = list(columns)
+    if hue is not None and hue not in columns:
+        _check_column_exists(df, hue)
+        df = df[columns + [hue]]
+    else:
+        df = df[columns]
+    df = _sample_rows(df, max_points, hue=hue)
     if ax is None:
-       plot = sns.pairplot(df[columns], hue=hue, palette=palette)
+       plot = sns.pairplot(df, hue=hue, palette=palette)
     else:
-       plot = sns.pairplot(df[columns], hue=hue, palette=palette, ax=ax)
+       plot = sns.pairplot(df, hue=hue, palette=palette, ax=ax)
     plot.fig.suptitle(title, y=1.02)
     if ax is None:
         plt.show()
\ No newline at end of file
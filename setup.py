@@ -12,8 +12,14 @@ setup(
         'scikit-learn',
         'matplotlib',
         'seaborn',
+        'pyarrow',
       # Add other dependencies if needed
     ],
+    extras_require={                      # Optional dependencies
+        'numba': ['numba'],
+        'dask': ['dask[dataframe]', 'dask-ml'],
+        'modin': ['modin'],
+    },
     author='Soory',
     author_email='soory.ranga@gmail.com',
     description='A Python library for data cleaning and analysis',